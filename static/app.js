@@ -0,0 +1,168 @@
+let lastTasks = JSON.parse(document.getElementById('initial-tasks').textContent);
+let refreshTimer = null;
+
+function updateFields() {
+    const type = document.getElementById('type').value;
+    const fileFields = document.getElementById('file-fields');
+    const backupField = document.getElementById('backup-field');
+    const cleanupFields = document.getElementById('cleanup-fields');
+    const alertField = document.getElementById('alert-field');
+
+    // Hide all fields first
+    fileFields.style.display = 'none';
+    backupField.style.display = 'none';
+    cleanupFields.style.display = 'none';
+    alertField.style.display = 'none';
+
+    if (type === 'file_cleanup') {
+        fileFields.style.display = 'block';
+        cleanupFields.style.display = 'block';
+    } else if (type === 'file_backup') {
+        fileFields.style.display = 'block';
+        backupField.style.display = 'block';
+    } else if (type === 'alert') {
+        alertField.style.display = 'block';
+    }
+}
+
+function el(tag, className, text) {
+    const node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+}
+
+function titleCase(text) {
+    // Same word splitting as Jinja's |title filter
+    return text.split(/([-\s({\[<]+)/)
+        .map(word => word ? word[0].toUpperCase() + word.slice(1).toLowerCase() : word)
+        .join('');
+}
+
+function taskDetail(label, value) {
+    const detail = el('div', 'task-detail');
+    detail.appendChild(el('strong', null, `${label}:`));
+    detail.appendChild(document.createTextNode(` ${value}`));
+    return detail;
+}
+
+function taskButton(className, text, onClick) {
+    const button = el('button', className, text);
+    button.addEventListener('click', onClick);
+    return button;
+}
+
+function buildTaskCard(name, task) {
+    const card = el('div', 'task-card');
+    card.dataset.name = name;
+
+    const header = el('div', 'task-header');
+    header.appendChild(el('div', 'task-name', name));
+    header.appendChild(el('div', `task-status ${task.enabled ? 'status-enabled' : 'status-disabled'}`,
+                          task.enabled ? 'Enabled' : 'Disabled'));
+    card.appendChild(header);
+
+    const details = el('div', 'task-details');
+    details.appendChild(taskDetail('Type', titleCase(task.type)));
+    details.appendChild(taskDetail('Schedule', task.schedule));
+    details.appendChild(taskDetail('Created', task.created));
+    if (task.last_run) {
+        details.appendChild(taskDetail('Last Run', task.last_run));
+    }
+    card.appendChild(details);
+
+    if (task.last_result) {
+        const result = taskDetail('Last Result', task.last_result);
+        result.style.marginBottom = '15px';
+        card.appendChild(result);
+    }
+
+    const actions = el('div', 'task-actions');
+    actions.appendChild(taskButton('btn', 'Run Now', () => executeTask(name)));
+    actions.appendChild(taskButton(`btn ${task.enabled ? 'btn-danger' : 'btn-success'}`,
+                                   task.enabled ? 'Disable' : 'Enable', () => toggleTask(name)));
+    actions.appendChild(taskButton('btn btn-danger', 'Delete', () => removeTask(name)));
+    card.appendChild(actions);
+    return card;
+}
+
+function renderTasks(state) {
+    const status = document.getElementById('scheduler-status');
+    status.className = `scheduler-status ${state.running ? 'scheduler-running' : 'scheduler-stopped'}`;
+    status.textContent = state.running ? '🟢 Scheduler Running' : '🔴 Scheduler Stopped';
+    const toggle = document.getElementById('scheduler-toggle');
+    toggle.className = `btn ${state.running ? 'btn-danger' : 'btn-success'}`;
+    toggle.textContent = state.running ? 'Stop Scheduler' : 'Start Scheduler';
+
+    const names = Object.keys(state.tasks);
+    document.getElementById('task-count').textContent = names.length;
+    document.getElementById('no-tasks').style.display = names.length ? 'none' : '';
+
+    // Only rebuild the cards whose task actually changed
+    const list = document.getElementById('task-list');
+    // Own-property checks and a Map, so tasks named "constructor" and the
+    // like don't collide with Object.prototype
+    const cards = new Map();
+    for (const card of list.querySelectorAll('.task-card')) {
+        if (Object.hasOwn(state.tasks, card.dataset.name)) {
+            cards.set(card.dataset.name, card);
+        } else {
+            card.remove();
+        }
+    }
+    for (const name of names) {
+        const task = state.tasks[name];
+        const card = cards.get(name);
+        const previous = Object.hasOwn(lastTasks, name) ? lastTasks[name] : undefined;
+        if (!card) {
+            list.appendChild(buildTaskCard(name, task));
+        } else if (JSON.stringify(task) !== JSON.stringify(previous)) {
+            card.replaceWith(buildTaskCard(name, task));
+        }
+    }
+    lastTasks = state.tasks;
+}
+
+async function refreshState() {
+    const response = await fetch('/state');
+    if (response.ok) {
+        const state = await response.json();
+        renderTasks(state);
+        // Run Now returns before the task finishes; keep refreshing
+        // until its result is in
+        clearTimeout(refreshTimer);
+        if (state.busy.length) {
+            refreshTimer = setTimeout(refreshState, 1000);
+        }
+    }
+}
+
+async function executeTask(name) {
+    const response = await fetch(`/execute/${name}`, { method: 'POST' });
+    if (response.ok) {
+        await refreshState();
+    }
+}
+
+async function toggleTask(name) {
+    const response = await fetch(`/toggle/${name}`, { method: 'POST' });
+    if (response.ok) {
+        await refreshState();
+    }
+}
+
+async function removeTask(name) {
+    if (confirm(`Are you sure you want to delete the task "${name}"?`)) {
+        const response = await fetch(`/remove/${name}`, { method: 'POST' });
+        if (response.ok) {
+            await refreshState();
+        }
+    }
+}
+
+async function toggleScheduler() {
+    const response = await fetch('/toggle_scheduler', { method: 'POST' });
+    if (response.ok) {
+        await refreshState();
+    }
+}
@@ -4,17 +4,45 @@ Task Automation Web App
 A web-based interface for scheduling routine tasks like file management and alerts.
 """
 
-from flask import Flask, render_template_string, request, jsonify, redirect, url_for
+from flask import Flask, request, jsonify, redirect, url_for
 import os
 import json
+import hashlib
+import re
+import stat
+import fnmatch
 import time
+import mmap
+import heapq
+import queue
 import shutil
-import schedule
+import atexit
 import threading
-from datetime import datetime
+import concurrent.futures
+from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
+DEBUG = os.getenv("APP_DEBUG") == "1"
+# Static files are served under content-hashed URLs (see static_url), so
+# browsers may keep them for a year without revalidating
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 60 * 60
+
+_GLOB_MAGIC = re.compile('[*?[]')
+# Longest the scheduler sleeps before re-checking the wall clock
+_MAX_SLEEP = 60
+# Reflink ioctl from linux/fs.h; fcntl only exports the name on Python 3.12+
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
 
 class TaskManager:
     def __init__(self):
@@ -22,25 +50,102 @@ class TaskManager:
         self.tasks = self.load_tasks()
         self.scheduler_thread = None
         self.running = False
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        # (next_run_epoch, task_name), ordered by next run
+        self._heap = []
+        self._dirty = False
+        self._write_q = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush)
+        self._copy_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1))
+        self._job_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="task")
+        self._inflight = {}
+        # O_APPEND makes each os.write land whole at the end of the log, so
+        # alerts from different threads need no lock of their own
+        self._alert_fd = os.open(
+            "web_alerts.log",
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0),
+            0o644)
         
     def load_tasks(self):
         if os.path.exists(self.config_file):
+            if os.path.getsize(self.config_file) == 0:
+                return {}
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                with open(self.config_file, 'rb') as f:
+                    if orjson is not None:
+                        # Parse straight out of the mapped pages, no bytes copy
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                                memoryview(mm) as view:
+                            tasks = orjson.loads(view)
+                    else:
+                        tasks = json.loads(f.read())
+            except ValueError:
                 return {}
+            # Older files stored ISO-8601 strings; timestamps are epoch seconds now
+            for task in tasks.values():
+                for key in ('created', 'last_run'):
+                    if isinstance(task.get(key), str):
+                        try:
+                            task[key] = int(datetime.fromisoformat(task[key]).timestamp())
+                        except (ValueError, OverflowError, OSError):
+                            # Unreadable value; don't let old data stop startup
+                            task[key] = None
+            return tasks
         return {}
     
     def save_tasks(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.tasks, f, indent=2)
+        # Only queue the write; the writer thread serializes off the request
+        # thread and folds bursts of edits and task runs into one write.
+        self._dirty = True
+        self._write_q.put(None)
+    
+    def flush(self):
+        with self._write_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            # Copy before encoding so request threads can keep mutating
+            snapshot = {name: dict(task) for name, task in list(self.tasks.items())}
+            if orjson is not None:
+                data = orjson.dumps(snapshot)
+            else:
+                data = json.dumps(snapshot, separators=(',', ':')).encode()
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+    
+    def _flush_loop(self):
+        while True:
+            self._write_q.get()
+            for _ in range(256):
+                try:
+                    self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self.flush()
+            except OSError:
+                # Likely transient (disk full, file locked): back off and
+                # retry without waiting for another edit to come along
+                self._dirty = True
+                time.sleep(1)
+                self._write_q.put(None)
+            except Exception:
+                # Keep the writer alive; the next save_tasks tries again
+                self._dirty = True
     
     def add_task(self, name, task_type, schedule_time, **kwargs):
         task = {
             'type': task_type,
             'schedule': schedule_time,
-            'created': datetime.now().isoformat(),
+            'created': int(time.time()),
             'enabled': True,
             'last_run': None,
             **kwargs
@@ -85,7 +190,7 @@ class TaskManager:
             elif task_type == "alert":
                 result = self.execute_alert(task['message'])
             
-            self.tasks[name]['last_run'] = datetime.now().isoformat()
+            self.tasks[name]['last_run'] = int(time.time())
             self.tasks[name]['last_result'] = result
             self.save_tasks()
             return True
@@ -96,17 +201,40 @@ class TaskManager:
     
     def execute_file_cleanup(self, source_dir, days_old=7, file_pattern="*"):
         try:
-            source_path = Path(source_dir)
-            if not source_path.exists():
+            if not os.path.exists(source_dir):
                 return f"Directory {source_dir} does not exist"
             
+            # Patterns are relative to source_dir; an absolute one would make
+            # os.path.join drop source_dir and reach files outside it
+            if os.path.isabs(file_pattern) or os.path.splitdrive(file_pattern)[0]:
+                return "Error: Non-relative patterns are unsupported"
+            
             cutoff_time = time.time() - (days_old * 24 * 60 * 60)
             deleted_count = 0
             
-            for file_path in source_path.glob(file_pattern):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
+            # A literal file name needs one lstat, not a directory listing
+            if not _GLOB_MAGIC.search(file_pattern):
+                file_path = os.path.join(source_dir, file_pattern)
+                try:
+                    st = os.lstat(file_path)
+                except OSError:
+                    return f"Deleted 0 files from {source_dir}"
+                if stat.S_ISREG(st.st_mode) and st.st_mtime < cutoff_time:
                     try:
-                        file_path.unlink()
+                        os.unlink(file_path)
+                        deleted_count += 1
+                    except Exception:
+                        pass
+                return f"Deleted {deleted_count} files from {source_dir}"
+            
+            for entry in self._scan_matching(source_dir, file_pattern):
+                # is_file() is answered from d_type without a syscall on most
+                # filesystems, so only regular files pay for the stat()
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                    try:
+                        os.unlink(entry.path)
                         deleted_count += 1
                     except Exception:
                         pass
@@ -115,6 +243,62 @@ class TaskManager:
         except Exception as e:
             return f"Error: {str(e)}"
     
+    def _scan_matching(self, source_dir, file_pattern):
+        # Walk with os.scandir so each entry costs one getdents slot rather
+        # than a Path object plus separate is_file()/stat() calls. Each path
+        # component of the pattern is matched in turn, with "**" standing
+        # for any number of directories, as Path.glob does.
+        parts = [part for part in file_pattern.replace(os.sep, '/').split('/')
+                 if part not in ('', '.')]
+        if not parts or parts[-1] == '**':
+            # Path.glob only yields directories for these; nothing to delete
+            return
+        
+        # Translate each component once rather than going through fnmatch's
+        # cache for every entry; a bare "*" needs no matching at all
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+        matchers = [None if part in ('*', '**') else
+                    re.compile(fnmatch.translate(part), flags).match
+                    for part in parts]
+        last = len(parts) - 1
+        
+        pending = [(source_dir, 0)]
+        visited = set()
+        while pending:
+            directory, index = pending.pop()
+            if (directory, index) in visited:
+                continue
+            visited.add((directory, index))
+            part = parts[index]
+            
+            if part == '**':
+                # Zero directories: try the next component right here
+                pending.append((directory, index + 1))
+            elif index < last and not _GLOB_MAGIC.search(part):
+                # A literal directory component needs no listing
+                pending.append((os.path.join(directory, part), index + 1))
+                continue
+            
+            try:
+                it = os.scandir(directory)
+            except OSError:
+                # Missing, not a directory, or unreadable: skip it like
+                # Path.glob does rather than abandoning the whole walk
+                continue
+            with it:
+                for entry in it:
+                    if part == '**':
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, index))
+                        continue
+                    match = matchers[index]
+                    if match is not None and not match(entry.name):
+                        continue
+                    if index == last:
+                        yield entry
+                    elif entry.is_dir():
+                        pending.append((entry.path, index + 1))
+    
     def execute_file_backup(self, source_dir, backup_dir):
         try:
             source_path = Path(source_dir)
@@ -127,450 +311,282 @@ class TaskManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_subdir = backup_path / f"backup_{timestamp}"
             
-            shutil.copytree(source_dir, backup_subdir)
+            self._copy_tree(source_dir, str(backup_subdir))
             return f"Backup completed: {source_dir} -> {backup_subdir}"
         except Exception as e:
             return f"Error: {str(e)}"
     
+    def _copy_tree(self, source_dir, dest_dir):
+        # Directories are created here, up front, so the copy workers never
+        # contend on mkdir; the file copies themselves fan out over the pool.
+        futures = []
+        copied_dirs = []
+        pending = [(source_dir, dest_dir)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.mkdir(dst_dir)
+            copied_dirs.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    dst = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        pending.append((entry.path, dst))
+                    else:
+                        futures.append(self._copy_pool.submit(self._copy_one, entry.path, dst))
+        
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+        # Writing into a directory bumps its mtime, so stamp them last
+        for src_dir, dst_dir in reversed(copied_dirs):
+            shutil.copystat(src_dir, dst_dir)
+    
+    def _copy_one(self, src, dst):
+        self._fast_copy(src, dst)
+        shutil.copystat(src, dst)
+    
+    def _fast_copy(self, src, dst):
+        # Keep the bytes in the kernel: reflink if the filesystem can share
+        # extents, else copy_file_range, else a plain user-space copy.
+        if not hasattr(os, 'copy_file_range'):
+            shutil.copyfile(src, dst)
+            return
+        
+        src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+            try:
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                        return
+                    except OSError:
+                        pass
+                
+                size = os.fstat(src_fd).st_size
+                if size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(dst_fd, 0, size)
+                    except OSError:
+                        pass
+                
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+                if copied < size:
+                    # Source shrank under us; drop the preallocated tail
+                    os.ftruncate(dst_fd, copied)
+                return
+            except OSError:
+                pass
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        
+        shutil.copyfile(src, dst)
+    
     def execute_alert(self, message):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         alert_msg = f"[{timestamp}] ALERT: {message}"
         
         # Log to file
-        with open("web_alerts.log", "a") as f:
-            f.write(alert_msg + "\n")
+        os.write(self._alert_fd, (alert_msg + "\n").encode())
         
         return f"Alert logged: {message}"
     
     def schedule_tasks(self):
-        schedule.clear()
+        now = time.time()
+        heap = []
         
         for name, task in self.tasks.items():
             if not task['enabled']:
                 continue
             
-            schedule_time = task['schedule']
-            job = lambda t=task, n=name: self.execute_task(n, t)
-            
-            if schedule_time.startswith("every"):
-                parts = schedule_time.split()
-                if len(parts) >= 2:
-                    interval = parts[1]
-                    if interval.endswith("m"):
-                        schedule.every(int(interval.rstrip("m"))).minutes.do(job)
-                    elif interval.endswith("h"):
-                        schedule.every(int(interval.rstrip("h"))).hours.do(job)
-                    elif interval == "day":
-                        schedule.every().day.do(job)
-            elif ":" in schedule_time:
-                schedule.every().day.at(schedule_time).do(job)
+            next_run = self._next_run(task['schedule'], now)
+            if next_run is not None:
+                heap.append((next_run, name))
+        
+        heapq.heapify(heap)
+        self._heap = heap
     
-    def run_scheduler(self):
-        self.schedule_tasks()
-        self.running = True
+    def _next_run(self, schedule_time, now):
+        # Malformed schedules (bad numbers, 25:00, ...) are ignored like any
+        # other unrecognised one, so one bad task can't stop the scheduler
+        try:
+            return self._parse_next_run(schedule_time, now)
+        except ValueError:
+            return None
+    
+    def _parse_next_run(self, schedule_time, now):
+        if schedule_time.startswith("every"):
+            parts = schedule_time.split()
+            if len(parts) >= 2:
+                interval = parts[1]
+                if interval.endswith("m"):
+                    minutes = int(interval.rstrip("m"))
+                    return now + minutes * 60 if minutes > 0 else None
+                elif interval.endswith("h"):
+                    hours = int(interval.rstrip("h"))
+                    return now + hours * 60 * 60 if hours > 0 else None
+                elif interval == "day":
+                    return now + 24 * 60 * 60
+        elif ":" in schedule_time:
+            # Daily at HH:MM[:SS], today if still ahead, otherwise tomorrow
+            fields = [int(part) for part in schedule_time.split(":")]
+            if len(fields) > 3:
+                return None
+            current = datetime.fromtimestamp(now)
+            at = current.replace(hour=fields[0], minute=fields[1],
+                                 second=fields[2] if len(fields) > 2 else 0,
+                                 microsecond=0)
+            if at <= current:
+                at += timedelta(days=1)
+            return at.timestamp()
+        return None
+    
+    def _run_pending(self):
+        now = time.time()
+        due = []
+        
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, name = heapq.heappop(self._heap)
+                task = self.tasks.get(name)
+                if task is None or not task['enabled']:
+                    continue
+                next_run = self._next_run(task['schedule'], now)
+                if next_run is not None:
+                    heapq.heappush(self._heap, (next_run, name))
+                due.append(name)
         
-        while self.running:
-            schedule.run_pending()
-            time.sleep(1)
+        for name in due:
+            self.submit_task(name)
+    
+    def submit_task(self, name):
+        # Run on the job pool so a slow task cannot hold up the scheduler,
+        # and skip it if its previous run (say, a long backup) is still going
+        with self._lock:
+            previous = self._inflight.get(name)
+            if previous is not None and not previous.done():
+                return None
+            future = self._job_pool.submit(self._fire, name)
+            self._inflight[name] = future
+        return future
+    
+    def _fire(self, name):
+        # Look the task up when the worker picks it up, not when it was
+        # queued, so edits or a delete in between are honoured
+        task = self.tasks.get(name)
+        if task is None:
+            return False
+        return self.execute_task(name, task)
+    
+    def busy_tasks(self):
+        with self._lock:
+            return [name for name, future in self._inflight.items() if not future.done()]
+    
+    def run_scheduler(self):
+        try:
+            with self._lock:
+                self.schedule_tasks()
+            
+            # Sleep until the next job is due instead of polling every second;
+            # stop/restart set the wake event to break out immediately.
+            while self.running:
+                with self._lock:
+                    idle = self._heap[0][0] - time.time() if self._heap else 3600
+                if idle > 0:
+                    # Event.wait runs on the monotonic clock, which stands
+                    # still across suspend and ignores wall-clock steps, so
+                    # wake at least once a minute to re-check time.time()
+                    self._wake.wait(timeout=min(idle, _MAX_SLEEP))
+                    self._wake.clear()
+                if not self.running:
+                    break
+                self._run_pending()
+        finally:
+            # Never report a dead loop as running, and let start_scheduler
+            # bring it back
+            self.running = False
     
     def start_scheduler(self):
         if not self.running:
+            # A previous loop may still be finishing after stop_scheduler
+            if self.scheduler_thread is not None and self.scheduler_thread.is_alive():
+                self.scheduler_thread.join()
+            self.running = True
+            self._wake.clear()
             self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
             self.scheduler_thread.start()
     
     def stop_scheduler(self):
         self.running = False
+        self._wake.set()
     
     def restart_scheduler(self):
-        self.stop_scheduler()
-        time.sleep(1)
-        self.start_scheduler()
+        # Rebuild the jobs in place and let the running loop recompute its
+        # sleep; no need to tear the thread down on every task edit.
+        with self._lock:
+            self.schedule_tasks()
+        self._wake.set()
 
 # Global task manager instance
 task_manager = TaskManager()
+# Start the scheduler by default, including when a WSGI server imports us
+task_manager.start_scheduler()
 
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Task Automation Dashboard</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container { 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }
-        .header { 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white; 
-            padding: 30px; 
-            text-align: center; 
-        }
-        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-        .header p { opacity: 0.9; font-size: 1.1em; }
-        .content { padding: 30px; }
-        .section { margin-bottom: 40px; }
-        .section h2 { 
-            color: #333; 
-            margin-bottom: 20px; 
-            font-size: 1.8em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }
-        .form-group { 
-            margin-bottom: 20px; 
-        }
-        .form-group label { 
-            display: block; 
-            margin-bottom: 8px; 
-            font-weight: 600;
-            color: #555;
-        }
-        .form-group input, .form-group select, .form-group textarea { 
-            width: 100%; 
-            padding: 12px; 
-            border: 2px solid #e1e5e9;
-            border-radius: 8px; 
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }
-        .form-group input:focus, .form-group select:focus, .form-group textarea:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-        .form-row { 
-            display: grid; 
-            grid-template-columns: 1fr 1fr; 
-            gap: 20px; 
-        }
-        .btn { 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white; 
-            padding: 12px 25px; 
-            border: none; 
-            border-radius: 8px; 
-            cursor: pointer; 
-            font-size: 16px;
-            font-weight: 600;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-        .btn:hover { 
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }
-        .btn-danger { 
-            background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-        }
-        .btn-danger:hover {
-            box-shadow: 0 5px 15px rgba(255, 107, 107, 0.4);
-        }
-        .btn-success { 
-            background: linear-gradient(135deg, #2ed573 0%, #1e90ff 100%);
-        }
-        .btn-success:hover {
-            box-shadow: 0 5px 15px rgba(46, 213, 115, 0.4);
-        }
-        .task-card { 
-            background: #f8f9ff;
-            border: 2px solid #e1e5e9;
-            border-radius: 12px; 
-            padding: 20px; 
-            margin-bottom: 20px;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-        .task-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }
-        .task-header { 
-            display: flex; 
-            justify-content: between; 
-            align-items: center; 
-            margin-bottom: 15px; 
-        }
-        .task-name { 
-            font-size: 1.3em; 
-            font-weight: 600; 
-            color: #333;
-        }
-        .task-status { 
-            padding: 5px 12px; 
-            border-radius: 20px; 
-            font-size: 0.9em; 
-            font-weight: 600;
-        }
-        .status-enabled { 
-            background: #d4edda; 
-            color: #155724; 
-        }
-        .status-disabled { 
-            background: #f8d7da; 
-            color: #721c24; 
-        }
-        .task-details { 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
-            gap: 10px; 
-            margin-bottom: 15px; 
-        }
-        .task-detail { 
-            font-size: 0.9em; 
-            color: #666; 
-        }
-        .task-detail strong { 
-            color: #333; 
-        }
-        .task-actions { 
-            display: flex; 
-            gap: 10px; 
-            flex-wrap: wrap; 
-        }
-        .status-bar {
-            background: #f8f9ff;
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        .scheduler-status {
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: 600;
-            margin: 0 10px;
-        }
-        .scheduler-running {
-            background: #d4edda;
-            color: #155724;
-        }
-        .scheduler-stopped {
-            background: #f8d7da;
-            color: #721c24;
-        }
-        @media (max-width: 768px) {
-            .form-row { grid-template-columns: 1fr; }
-            .task-actions { justify-content: center; }
-            .header h1 { font-size: 2em; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Task Automation Dashboard</h1>
-            <p>Schedule and manage your routine tasks with ease</p>
-        </div>
-        
-        <div class="content">
-            <div class="status-bar">
-                <span class="scheduler-status {{ 'scheduler-running' if scheduler_running else 'scheduler-stopped' }}">
-                    {{ '🟢 Scheduler Running' if scheduler_running else '🔴 Scheduler Stopped' }}
-                </span>
-                <button class="btn {{ 'btn-danger' if scheduler_running else 'btn-success' }}" 
-                        onclick="toggleScheduler()">
-                    {{ 'Stop Scheduler' if scheduler_running else 'Start Scheduler' }}
-                </button>
-            </div>
+_static_versions = {}
 
-            <div class="section">
-                <h2>➕ Add New Task</h2>
-                <form method="POST" action="/add_task">
-                    <div class="form-row">
-                        <div class="form-group">
-                            <label for="name">Task Name:</label>
-                            <input type="text" id="name" name="name" required>
-                        </div>
-                        <div class="form-group">
-                            <label for="type">Task Type:</label>
-                            <select id="type" name="type" required onchange="updateFields()">
-                                <option value="">Select Type</option>
-                                <option value="file_cleanup">File Cleanup</option>
-                                <option value="file_backup">File Backup</option>
-                                <option value="alert">Alert/Reminder</option>
-                            </select>
-                        </div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="schedule">Schedule:</label>
-                        <select id="schedule" name="schedule" required>
-                            <option value="every 30m">Every 30 minutes</option>
-                            <option value="every 1h">Every hour</option>
-                            <option value="every 2h">Every 2 hours</option>
-                            <option value="every day">Every day</option>
-                            <option value="09:00">Daily at 9:00 AM</option>
-                            <option value="18:00">Daily at 6:00 PM</option>
-                        </select>
-                    </div>
-                    
-                    <div id="file-fields" style="display: none;">
-                        <div class="form-group">
-                            <label for="source_dir">Source Directory:</label>
-                            <input type="text" id="source_dir" name="source_dir" placeholder="/path/to/source">
-                        </div>
-                        <div id="backup-field" class="form-group" style="display: none;">
-                            <label for="backup_dir">Backup Directory:</label>
-                            <input type="text" id="backup_dir" name="backup_dir" placeholder="/path/to/backup">
-                        </div>
-                        <div id="cleanup-fields" style="display: none;">
-                            <div class="form-row">
-                                <div class="form-group">
-                                    <label for="days_old">Days Old:</label>
-                                    <input type="number" id="days_old" name="days_old" value="7" min="1">
-                                </div>
-                                <div class="form-group">
-                                    <label for="file_pattern">File Pattern:</label>
-                                    <input type="text" id="file_pattern" name="file_pattern" value="*" placeholder="*.tmp">
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div id="alert-field" class="form-group" style="display: none;">
-                        <label for="message">Alert Message:</label>
-                        <textarea id="message" name="message" rows="3" placeholder="Enter your alert message"></textarea>
-                    </div>
-                    
-                    <button type="submit" class="btn">Add Task</button>
-                </form>
-            </div>
+def static_url(filename):
+    # Versioned by content so a changed file gets a new URL despite the
+    # immutable caching
+    version = _static_versions.get(filename)
+    if version is None:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            # Only a cache-busting tag; usedforsecurity keeps FIPS builds happy
+            version = hashlib.md5(f.read(), usedforsecurity=False).hexdigest()[:12]
+        _static_versions[filename] = version
+    return url_for('static', filename=filename, v=version)
 
-            <div class="section">
-                <h2>📋 Active Tasks ({{ tasks|length }})</h2>
-                {% if tasks %}
-                    {% for name, task in tasks.items() %}
-                    <div class="task-card">
-                        <div class="task-header">
-                            <div class="task-name">{{ name }}</div>
-                            <div class="task-status {{ 'status-enabled' if task.enabled else 'status-disabled' }}">
-                                {{ 'Enabled' if task.enabled else 'Disabled' }}
-                            </div>
-                        </div>
-                        
-                        <div class="task-details">
-                            <div class="task-detail">
-                                <strong>Type:</strong> {{ task.type|title }}
-                            </div>
-                            <div class="task-detail">
-                                <strong>Schedule:</strong> {{ task.schedule }}
-                            </div>
-                            <div class="task-detail">
-                                <strong>Created:</strong> {{ task.created[:16] }}
-                            </div>
-                            {% if task.last_run %}
-                            <div class="task-detail">
-                                <strong>Last Run:</strong> {{ task.last_run[:16] }}
-                            </div>
-                            {% endif %}
-                        </div>
-                        
-                        {% if task.last_result %}
-                        <div class="task-detail" style="margin-bottom: 15px;">
-                            <strong>Last Result:</strong> {{ task.last_result }}
-                        </div>
-                        {% endif %}
-                        
-                        <div class="task-actions">
-                            <button class="btn" onclick="executeTask('{{ name }}')">
-                                Run Now
-                            </button>
-                            <button class="btn {{ 'btn-danger' if task.enabled else 'btn-success' }}" 
-                                    onclick="toggleTask('{{ name }}')">
-                                {{ 'Disable' if task.enabled else 'Enable' }}
-                            </button>
-                            <button class="btn btn-danger" onclick="removeTask('{{ name }}')">
-                                Delete
-                            </button>
-                        </div>
-                    </div>
-                    {% endfor %}
-                {% else %}
-                    <div class="task-card">
-                        <p style="text-align: center; color: #666; font-size: 1.1em;">
-                            No tasks configured yet. Add your first task above! 🎯
-                        </p>
-                    </div>
-                {% endif %}
-            </div>
-        </div>
-    </div>
+def fmt_ts(ts):
+    if ts is None:
+        return ''
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
 
-    <script>
-        function updateFields() {
-            const type = document.getElementById('type').value;
-            const fileFields = document.getElementById('file-fields');
-            const backupField = document.getElementById('backup-field');
-            const cleanupFields = document.getElementById('cleanup-fields');
-            const alertField = document.getElementById('alert-field');
-            
-            // Hide all fields first
-            fileFields.style.display = 'none';
-            backupField.style.display = 'none';
-            cleanupFields.style.display = 'none';
-            alertField.style.display = 'none';
-            
-            if (type === 'file_cleanup') {
-                fileFields.style.display = 'block';
-                cleanupFields.style.display = 'block';
-            } else if (type === 'file_backup') {
-                fileFields.style.display = 'block';
-                backupField.style.display = 'block';
-            } else if (type === 'alert') {
-                alertField.style.display = 'block';
-            }
-        }
-        
-        async function executeTask(name) {
-            const response = await fetch(`/execute/${name}`, { method: 'POST' });
-            if (response.ok) {
-                location.reload();
-            }
-        }
-        
-        async function toggleTask(name) {
-            const response = await fetch(`/toggle/${name}`, { method: 'POST' });
-            if (response.ok) {
-                location.reload();
-            }
-        }
-        
-        async function removeTask(name) {
-            if (confirm(`Are you sure you want to delete the task "${name}"?`)) {
-                const response = await fetch(`/remove/${name}`, { method: 'POST' });
-                if (response.ok) {
-                    location.reload();
-                }
-            }
-        }
-        
-        async function toggleScheduler() {
-            const response = await fetch('/toggle_scheduler', { method: 'POST' });
-            if (response.ok) {
-                location.reload();
-            }
-        }
-    </script>
-</body>
-</html>
-"""
+def client_tasks():
+    # Timestamps go to the browser already formatted, in the server's
+    # timezone, so cards rebuilt client-side match the server-rendered ones
+    return {name: dict(task, created=fmt_ts(task.get('created')),
+                       last_run=fmt_ts(task.get('last_run')))
+            for name, task in list(task_manager.tasks.items())}
+
+app.jinja_env.globals['static_url'] = static_url
+app.jinja_env.filters['fmt_ts'] = fmt_ts
+
+# Compile once at import instead of re-parsing the page on every request
+_TEMPLATE = app.jinja_env.get_template('index.html')
+
+@app.after_request
+def cache_static(response):
+    if request.endpoint == 'static':
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    return response
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE, 
-                                tasks=task_manager.tasks, 
-                                scheduler_running=task_manager.running)
+    return _TEMPLATE.render(tasks=task_manager.tasks, 
+                            client_tasks=client_tasks(),
+                            scheduler_running=task_manager.running)
+
+@app.route('/state')
+def state():
+    return jsonify(tasks=client_tasks(), running=task_manager.running,
+                   busy=task_manager.busy_tasks())
 
 @app.route('/add_task', methods=['POST'])
 def add_task():
@@ -594,8 +610,10 @@ def add_task():
 
 @app.route('/execute/<name>', methods=['POST'])
 def execute_task(name):
+    # Run on the job pool so a long backup does not hold this request (and
+    # the rest of the dashboard) until it finishes
     if name in task_manager.tasks:
-        task_manager.execute_task(name, task_manager.tasks[name])
+        task_manager.submit_task(name)
     return jsonify({'status': 'success'})
 
 @app.route('/toggle/<name>', methods=['POST'])
@@ -617,11 +635,11 @@ def toggle_scheduler():
     return jsonify({'status': 'success'})
 
 if __name__ == '__main__':
-    # Start the scheduler by default
-    task_manager.start_scheduler()
-    
     print("🚀 Task Automation Web App Starting...")
     print("📱 Open your browser and go to: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop the server")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; see the README for running under a WSGI server.
+    # The reloader stays off: it would fork a second process with its own
+    # scheduler running the same tasks.
+    app.run(debug=DEBUG, use_reloader=False, threaded=True, host='0.0.0.0', port=5000)
\ No newline at end of file